@@ -15,19 +15,81 @@ This script:
 - Prints clean order summaries
 """
 
-import argparse
+from __future__ import annotations
+
+import csv
+import hashlib
+import hmac
+import json
 import logging
+import math
 import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
-
-from binance.client import Client
-from binance.exceptions import (
-    BinanceAPIException,
-    BinanceRequestException,
-    BinanceOrderException,
+from decimal import (
+    Context,
+    Decimal,
+    DecimalException,
+    ROUND_DOWN,
+    ROUND_UP,
+    localcontext,
+)
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Callable,
+    Dict,
+    Any,
+    List,
+    Sequence,
+    TextIO,
+    Union,
 )
 
+# python-binance (and its HTTP stack), websockets and numba are imported on
+# first use, so --help and input validation do not pay for loading them.
+
+try:
+    # Optional: faster JSON encoding/decoding when available.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+if TYPE_CHECKING:
+    # Imported lazily in parse_args; --fast-cli runs never load argparse.
+    import argparse
+
+# Shared arithmetic context for prices; 18 significant digits covers every
+# Binance futures price/tick combination.
+_DECIMAL_CTX = Context(prec=18)
+
+# ---------------------------------------------------------------------------
+# JSON helpers
+# ---------------------------------------------------------------------------
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Encode obj as compact JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
+
+
 # ---------------------------------------------------------------------------
 # Logging configuration
 # ---------------------------------------------------------------------------
@@ -35,8 +97,33 @@ from binance.exceptions import (
 LOGGER = logging.getLogger("basic_futures_bot")
 
 
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter that renders the timestamp once per wall-clock second."""
+
+    def __init__(self, fmt: str, datefmt: str) -> None:
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        # (second, formatted text), swapped as one tuple so threads never see
+        # a second paired with another second's text.
+        self._cached: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_text = self._cached
+        if second != cached_second:
+            cached_text = time.strftime(datefmt, self.converter(second))
+            self._cached = (second, cached_text)
+        return cached_text
+
+
 def setup_logging(level: int = logging.INFO) -> None:
     """Configure root logger for the bot."""
+    # The format below never uses thread/process fields; skip collecting them.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     logger = logging.getLogger()
     logger.setLevel(level)
 
@@ -47,7 +134,7 @@ def setup_logging(level: int = logging.INFO) -> None:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
 
-    formatter = logging.Formatter(
+    formatter = _SecondCachedFormatter(
         fmt="%(asctime)s | %(name)s | %(levelname)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
@@ -62,9 +149,22 @@ def setup_logging(level: int = logging.INFO) -> None:
 
 
 class TradingBotError(Exception):
-    """Base exception type for trading bot errors."""
+    """
+    Base exception type for trading bot errors.
+
+    The underlying exception, if any, is kept as `orig` and only formatted
+    into the message when the error is displayed.
+    """
+
+    def __init__(self, message: str, orig: Optional[BaseException] = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.orig = orig
 
-    pass
+    def __str__(self) -> str:
+        if self.orig is None:
+            return self.message
+        return f"{self.message}: {self.orig}"
 
 
 @dataclass
@@ -75,14 +175,89 @@ class OrderParams:
     side: str
     order_type: str
     quantity: float
-    price: Optional[float] = None
-    stop_price: Optional[float] = None
+    price: Optional[Decimal] = None
+    stop_price: Optional[Decimal] = None
+
+
+class _OrderPayload:
+    """Binance Futures order request parameters with a fixed attribute layout."""
+
+    __slots__ = (
+        "symbol",
+        "side",
+        "type",
+        "quantity",
+        "timeInForce",
+        "price",
+        "stopPrice",
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        side: str,
+        type: str,
+        quantity: Any,
+        timeInForce: Optional[str] = None,
+        price: Any = None,
+        stopPrice: Any = None,
+    ) -> None:
+        self.symbol = symbol
+        self.side = side
+        self.type = type
+        self.quantity = quantity
+        self.timeInForce = timeInForce
+        self.price = price
+        self.stopPrice = stopPrice
+
+    def as_params(self) -> Dict[str, Any]:
+        """Return the request parameters that are set, keyed by API name."""
+        params: Dict[str, Any] = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                params[name] = value
+        return params
 
 
 # ---------------------------------------------------------------------------
 # Validation logic
 # ---------------------------------------------------------------------------
 
+# Letters/digits, plus "_" for dated contracts such as BTCUSDT_250627.
+_SYMBOL_RE = re.compile(r"\A[A-Z0-9_]{6,20}\Z")
+_SIDES = frozenset(("BUY", "SELL"))
+_ORDER_TYPES = frozenset(("MARKET", "LIMIT", "STOP_LIMIT"))
+_PRICED_ORDER_TYPES = frozenset(("LIMIT", "STOP_LIMIT"))
+_TYPE_ALIASES = {
+    "MKT": "MARKET",
+    "STOP-LIMIT": "STOP_LIMIT",
+    "STOPLIMIT": "STOP_LIMIT",
+}
+
+
+def _check_positive(f: float) -> bool:
+    """Return True if f is strictly positive (NaN is not)."""
+    return f > 0.0
+
+
+@lru_cache(maxsize=None)
+def _positive_check() -> Callable[[float], bool]:
+    """
+    Return _check_positive, JIT-compiled with Numba when it is installed.
+
+    Numba is optional and imported/compiled on the first numeric validation
+    rather than at module import, so runs that never validate a number
+    (--help, argument errors) do not load it.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _check_positive
+    compiled = njit(cache=True)(_check_positive)
+    compiled(1.0)  # compile now rather than mid-validation
+    return compiled
+
 
 class InputValidator:
     """Validation utilities for CLI/user inputs."""
@@ -90,21 +265,25 @@ class InputValidator:
     @staticmethod
     def validate_symbol(symbol: str) -> str:
         """Validate and normalize a futures symbol (e.g., BTCUSDT)."""
-        if not symbol or not symbol.strip():
+        if symbol is not None and not isinstance(symbol, str):
+            raise ValueError("Symbol must be a string.")
+        symbol = (symbol or "").strip().upper()
+        if not symbol:
             raise ValueError("Symbol must not be empty.")
-        symbol = symbol.strip().upper()
         # Simple sanity check; Binance will do full validation.
-        if len(symbol) < 6:
-            raise ValueError("Symbol looks invalid (too short). Example: BTCUSDT.")
+        if not _SYMBOL_RE.match(symbol):
+            raise ValueError("Symbol looks invalid. Example: BTCUSDT.")
         return symbol
 
     @staticmethod
     def validate_side(side: str) -> str:
         """Validate order side: BUY or SELL."""
+        if side is not None and not isinstance(side, str):
+            raise ValueError("Side must be a string (BUY or SELL).")
         if not side:
             raise ValueError("Side must be provided (BUY or SELL).")
         side_upper = side.strip().upper()
-        if side_upper not in {"BUY", "SELL"}:
+        if side_upper not in _SIDES:
             raise ValueError("Side must be BUY or SELL.")
         return side_upper
 
@@ -118,33 +297,51 @@ class InputValidator:
         - LIMIT
         - STOP_LIMIT (advanced example)
         """
+        if order_type is not None and not isinstance(order_type, str):
+            raise ValueError("Order type must be a string.")
         if not order_type:
             raise ValueError("Order type must be provided.")
         t = order_type.strip().upper()
-        aliases = {
-            "MKT": "MARKET",
-            "STOP-LIMIT": "STOP_LIMIT",
-            "STOPLIMIT": "STOP_LIMIT",
-        }
-        t = aliases.get(t, t)
+        t = _TYPE_ALIASES.get(t, t)
 
-        if t not in {"MARKET", "LIMIT", "STOP_LIMIT"}:
+        if t not in _ORDER_TYPES:
             raise ValueError("Order type must be MARKET, LIMIT, or STOP_LIMIT.")
         return t
 
     @staticmethod
     def validate_positive_float(value: str, field_name: str) -> float:
-        """Validate that value is a positive float."""
+        """Validate that value is a positive, finite float."""
         try:
             f = float(value)
         except (TypeError, ValueError):
             raise ValueError(f"{field_name} must be a number.")
-        if f <= 0:
+        if not _positive_check()(f):
             raise ValueError(f"{field_name} must be greater than 0.")
+        if not math.isfinite(f):
+            raise ValueError(f"{field_name} must be a finite number.")
         return f
 
     @staticmethod
-    def validate_order_params(args: argparse.Namespace) -> OrderParams:
+    def validate_positive_decimal(value: Any, field_name: str) -> Decimal:
+        """Validate that value is a positive decimal number (e.g., a price)."""
+        try:
+            with localcontext(_DECIMAL_CTX):
+                d = +Decimal(str(value).strip())
+        except DecimalException:
+            # Not a number, or out of range for the shared context (Overflow).
+            raise ValueError(f"{field_name} must be a number.")
+        if not d.is_finite() or d <= 0:
+            raise ValueError(f"{field_name} must be greater than 0.")
+        # Keep the integer part within the context's precision, so the value
+        # formats to a sane string and tick rounding cannot overflow.
+        if d.adjusted() >= _DECIMAL_CTX.prec:
+            raise ValueError(f"{field_name} is too large.")
+        return d
+
+    @staticmethod
+    def validate_order_params(
+        args: argparse.Namespace | SimpleNamespace,
+    ) -> OrderParams:
         """Validate and normalize all order-related CLI arguments."""
         symbol = InputValidator.validate_symbol(args.symbol)
         side = InputValidator.validate_side(args.side)
@@ -154,15 +351,15 @@ class InputValidator:
         price = None
         stop_price = None
 
-        if order_type in {"LIMIT", "STOP_LIMIT"}:
+        if order_type in _PRICED_ORDER_TYPES:
             if args.price is None:
                 raise ValueError("Price is required for LIMIT and STOP_LIMIT orders.")
-            price = InputValidator.validate_positive_float(args.price, "Price")
+            price = InputValidator.validate_positive_decimal(args.price, "Price")
 
         if order_type == "STOP_LIMIT":
             if args.stop_price is None:
                 raise ValueError("stop-price is required for STOP_LIMIT orders.")
-            stop_price = InputValidator.validate_positive_float(
+            stop_price = InputValidator.validate_positive_decimal(
                 args.stop_price, "Stop price"
             )
 
@@ -181,6 +378,125 @@ class InputValidator:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=None)
+def _binance() -> SimpleNamespace:
+    """
+    Import python-binance and build the bot's client class (once per process).
+
+    Returns a namespace with the client class, the tuple of python-binance
+    exception types, and which futures URL attributes this python-binance
+    version exposes.
+    """
+    from binance.client import Client
+    from binance.exceptions import (
+        BinanceAPIException,
+        BinanceRequestException,
+        BinanceOrderException,
+    )
+
+    class _FuturesClient(Client):
+        """
+        python-binance Client that signs requests from a prepared HMAC state.
+
+        hmac.new() pads and hashes the secret key for every signature; copying
+        a keyed template skips that setup on each signed request.
+        """
+
+        def __init__(self, api_key: str, api_secret: str, **kwargs: Any) -> None:
+            # Set before Client.__init__, which may already issue requests.
+            self._hmac_template = hmac.new(
+                api_secret.encode("utf-8"), digestmod=hashlib.sha256
+            )
+            super().__init__(api_key, api_secret, **kwargs)
+
+        def _hmac_signature(self, query_string: str) -> str:
+            # python-binance builds the query string and picks HMAC vs.
+            # RSA/Ed25519 itself; only the HMAC digest step is replaced.
+            h = self._hmac_template.copy()
+            h.update(query_string.encode("utf-8"))
+            return h.hexdigest()
+
+    return SimpleNamespace(
+        Client=_FuturesClient,
+        errors=(BinanceAPIException, BinanceOrderException, BinanceRequestException),
+        # python-binance versions differ in which futures URL attributes they
+        # expose; detect them once rather than on every BasicBot construction.
+        has_futures_url=hasattr(Client, "FUTURES_URL"),
+        has_futures_data_url=hasattr(Client, "FUTURES_DATA_URL"),
+    )
+
+
+def _build_market(params: OrderParams) -> _OrderPayload:
+    """Build a MARKET order payload."""
+    return _OrderPayload(
+        symbol=params.symbol,
+        side=params.side,
+        type="MARKET",
+        quantity=params.quantity,
+    )
+
+
+def _build_limit(params: OrderParams) -> _OrderPayload:
+    """Build a good-till-cancelled LIMIT order payload."""
+    return _OrderPayload(
+        symbol=params.symbol,
+        side=params.side,
+        type="LIMIT",
+        quantity=params.quantity,
+        timeInForce="GTC",
+        price=format(params.price, "f"),
+    )
+
+
+def _build_stop_limit(params: OrderParams) -> _OrderPayload:
+    """
+    Build a STOP-LIMIT order payload.
+
+    Implemented as a STOP order with price + stopPrice; see the Binance UM
+    Futures docs for STOP orders.
+    """
+    return _OrderPayload(
+        symbol=params.symbol,
+        side=params.side,
+        type="STOP",
+        quantity=params.quantity,
+        timeInForce="GTC",
+        price=format(params.price, "f"),
+        stopPrice=format(params.stop_price, "f"),
+    )
+
+
+# Validated order type -> payload builder.
+_PAYLOAD_BUILDERS = {
+    "MARKET": _build_market,
+    "LIMIT": _build_limit,
+    "STOP_LIMIT": _build_stop_limit,
+}
+
+
+class _RateLimiter:
+    """Thread-safe sliding-window limiter: at most `rate` acquisitions per `period` seconds."""
+
+    def __init__(self, rate: int, period: float = 1.0) -> None:
+        self._rate = rate
+        self._period = period
+        self._stamps: deque = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until another acquisition fits in the current window."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._stamps and now - self._stamps[0] >= self._period:
+                    self._stamps.popleft()
+                if len(self._stamps) < self._rate:
+                    self._stamps.append(now)
+                    return
+                wait = self._period - (now - self._stamps[0])
+            time.sleep(wait)
+
+
 class BasicBot:
     """
     Basic Binance USDT-M Futures Testnet bot.
@@ -190,6 +506,21 @@ class BasicBot:
     """
 
     TESTNET_FUTURES_BASE_URL = "https://testnet.binancefuture.com/fapi"
+    TESTNET_FUTURES_WS_API_URL = "wss://testnet.binancefuture.com/ws-fapi/v1"
+
+    # Connection pool sizing for the shared HTTP session. pool_maxsize bounds
+    # how many keep-alive connections can be reused concurrently (see
+    # place_orders); retries are left to the caller so orders are never
+    # silently resubmitted.
+    HTTP_POOL_CONNECTIONS = 10
+    HTTP_POOL_MAXSIZE = 50
+
+    # Binance Futures allows 10 orders per second per account.
+    ORDER_RATE_LIMIT = 10
+
+    # Seconds to wait for the reply to a WebSocket order request before the
+    # connection is treated as dead.
+    WS_REPLY_TIMEOUT = 10.0
 
     def __init__(self, api_key: str, api_secret: str, testnet: bool = True) -> None:
         """
@@ -208,52 +539,269 @@ class BasicBot:
             # Enforce testnet-only usage by design.
             raise TradingBotError("This bot is restricted to Binance Futures TESTNET.")
 
-        self.client = Client(api_key, api_secret, testnet=True)
+        binance = _binance()
+        self.client = binance.Client(api_key, api_secret, testnet=True)
+        self._api_key = api_key
+
+        # WebSocket order entry session (see start_ws_order_session). _ws is
+        # the live connection; it is dropped on failure and reopened on the
+        # next order while _use_ws is set.
+        self._use_ws = False
+        self._ws = None
+        self._ws_lock = threading.Lock()
+        self._ws_replies: Dict[str, Dict[str, Any]] = {}
+
+        self._order_limiter = _RateLimiter(self.ORDER_RATE_LIMIT)
+
+        # Symbol filters (LOT_SIZE, PRICE_FILTER, ...) keyed by symbol, so
+        # quantities and prices can be rounded locally instead of being
+        # rejected by Binance after a full round-trip.
+        self._filters: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        try:
+            info = self.client.futures_exchange_info()
+            self._filters = {
+                s["symbol"]: {f["filterType"]: f for f in s["filters"]}
+                for s in info["symbols"]
+            }
+        except Exception as e:
+            LOGGER.warning(
+                "Could not load exchange info; order values will not be "
+                "pre-validated: %s",
+                str(e),
+            )
 
         # Explicitly set Futures testnet base URLs to ensure we never hit mainnet.
         # Note: python-binance uses these attributes internally for futures endpoints.
-        if hasattr(self.client, "FUTURES_URL"):
+        if binance.has_futures_url:
             self.client.FUTURES_URL = self.TESTNET_FUTURES_BASE_URL
-        if hasattr(self.client, "FUTURES_DATA_URL"):
+        if binance.has_futures_data_url:
             self.client.FUTURES_DATA_URL = self.TESTNET_FUTURES_BASE_URL
 
+        # Reuse TCP/TLS connections across orders instead of paying a new
+        # handshake whenever the default (small) pool is exhausted.
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(
+            pool_connections=self.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.HTTP_POOL_MAXSIZE,
+            max_retries=0,
+        )
+        self.client.session.mount("https://", adapter)
+        self.client.session.headers["Connection"] = "keep-alive"
+
         LOGGER.info("Initialized Binance Futures TESTNET client.")
 
-    def _build_order_payload(self, params: OrderParams) -> Dict[str, Any]:
+    def start_ws_order_session(self) -> None:
         """
-        Map our normalized parameters to Binance Futures API parameters.
+        Open a persistent WebSocket API session for order entry.
 
-        This bot sends all orders as standard futures orders:
-        - MARKET
-        - LIMIT
-        - STOP (used as STOP-LIMIT)
+        While the session is open, place_order sends MARKET and LIMIT orders
+        over this single authenticated connection instead of one signed HTTPS
+        request each. STOP_LIMIT orders are rejected while it is open. If the
+        connection drops (Binance closes it after 24 hours), the next order
+        reconnects.
         """
-        payload: Dict[str, Any] = {
-            "symbol": params.symbol,
-            "side": params.side,
-            "type": None,  # filled below
-            "quantity": params.quantity,
+        if self._use_ws:
+            return
+        with self._ws_lock:
+            self._ws = self._connect_ws()
+        self._use_ws = True
+
+    def close_ws_order_session(self) -> None:
+        """Close the WebSocket order session, if one is open."""
+        if not self._use_ws:
+            return
+        self._use_ws = False
+        with self._ws_lock:
+            self._drop_ws()
+        LOGGER.info("Closed WebSocket order session.")
+
+    def _connect_ws(self) -> Any:
+        """Open a WebSocket API connection to the testnet."""
+        try:
+            from websockets.sync.client import connect as ws_connect
+        except ImportError:
+            raise TradingBotError(
+                "WebSocket order entry requires the 'websockets' package "
+                "(pip install websockets)."
+            ) from None
+        try:
+            ws = ws_connect(self.TESTNET_FUTURES_WS_API_URL)
+        except Exception as e:
+            LOGGER.error("Could not open WebSocket order session: %s", e)
+            raise TradingBotError("Could not open WebSocket order session", e)
+        LOGGER.info("Opened Binance Futures TESTNET WebSocket order session.")
+        return ws
+
+    def _drop_ws(self) -> None:
+        """Close and forget the current connection. Caller holds _ws_lock."""
+        ws, self._ws = self._ws, None
+        self._ws_replies.clear()
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception as e:
+                LOGGER.debug("Error while closing WebSocket connection: %s", e)
+
+    def _ws_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a signed request over the WebSocket session and wait for its reply.
+
+        Replies are matched to requests by id; replies belonging to other
+        requests are parked until their sender picks them up.
+        """
+        signed: Dict[str, Any] = {
+            **params,
+            "apiKey": self._api_key,
+            # Same clock correction python-binance applies to REST requests.
+            "timestamp": int(time.time() * 1000 + self.client.timestamp_offset),
         }
+        query_string = "&".join(f"{k}={v}" for k, v in sorted(signed.items()))
+        signed["signature"] = self.client._hmac_signature(query_string)
+
+        request_id = uuid.uuid4().hex
+        message = _json_dumps({"id": request_id, "method": method, "params": signed})
+
+        with self._ws_lock:
+            if self._ws is None:
+                self._ws = self._connect_ws()
+            try:
+                self._ws.send(message)
+            except Exception as e:
+                # The connection was already closed, so the order never left;
+                # reconnect once and send it again.
+                LOGGER.warning("WebSocket order session lost (%s); reconnecting.", e)
+                self._drop_ws()
+                self._ws = self._connect_ws()
+                self._ws.send(message)
+
+            deadline = time.monotonic() + self.WS_REPLY_TIMEOUT
+            try:
+                while request_id not in self._ws_replies:
+                    remaining = max(deadline - time.monotonic(), 0.0)
+                    reply = _json_loads(self._ws.recv(timeout=remaining))
+                    self._ws_replies[reply.get("id")] = reply
+            except TimeoutError:
+                self._drop_ws()
+                LOGGER.error(
+                    "No WebSocket reply within %ss; order status unknown.",
+                    self.WS_REPLY_TIMEOUT,
+                )
+                raise TradingBotError(
+                    f"No reply to {method} within {self.WS_REPLY_TIMEOUT}s; "
+                    "order status unknown."
+                )
+            except Exception as e:
+                # Sent but unanswered: do not resend, the order may be live.
+                self._drop_ws()
+                LOGGER.error("WebSocket order session failed: %s", e)
+                raise TradingBotError(
+                    "WebSocket order session failed before the reply; order status unknown",
+                    e,
+                )
+            reply = self._ws_replies.pop(request_id)
+
+        if reply.get("status") != 200:
+            error = reply.get("error") or {}
+            LOGGER.error(
+                "Binance API error: code=%s msg=%s", error.get("code"), error.get("msg")
+            )
+            raise TradingBotError(
+                f"Binance API error: code={error.get('code')} msg={error.get('msg')}"
+            )
+        return reply["result"]
 
-        if params.order_type == "MARKET":
-            payload["type"] = "MARKET"
+    @staticmethod
+    def _quantize(value: Union[str, float], step: str, rounding: str) -> str:
+        """Round value to a multiple of step and format it as a plain string."""
+        try:
+            with localcontext(_DECIMAL_CTX):
+                step_dec = Decimal(step)
+                value_dec = Decimal(str(value))
+                if step_dec <= 0:
+                    return format(value_dec.normalize(), "f")
+                steps = (value_dec / step_dec).to_integral_value(rounding=rounding)
+                return format((steps * step_dec).normalize(), "f")
+        except DecimalException as e:
+            # e.g. Overflow for a huge value divided by a small step.
+            raise TradingBotError(
+                f"Value {value} cannot be rounded to step size {step}", e
+            )
 
-        elif params.order_type == "LIMIT":
-            payload["type"] = "LIMIT"
-            payload["timeInForce"] = "GTC"
-            payload["price"] = params.price
+    @staticmethod
+    def _log_adjustment(
+        payload: _OrderPayload, field: str, original: Any, adjusted: str, step: str
+    ) -> None:
+        """Warn when rounding to the symbol's filters changed a value."""
+        if Decimal(adjusted) != Decimal(str(original)):
+            LOGGER.warning(
+                "Adjusted %s for %s %s order from %s to %s (step %s).",
+                field,
+                payload.symbol,
+                payload.side,
+                original,
+                adjusted,
+                step,
+            )
 
-        elif params.order_type == "STOP_LIMIT":
-            # Implement STOP-LIMIT as a STOP order with price + stopPrice
-            # See Binance UM Futures docs for STOP orders.
-            payload["type"] = "STOP"
-            payload["timeInForce"] = "GTC"
-            payload["price"] = params.price
-            payload["stopPrice"] = params.stop_price
+    def _apply_symbol_filters(self, payload: _OrderPayload) -> None:
+        """
+        Round quantity/price fields in payload to the symbol's step/tick size.
 
-        else:
+        Quantity is rounded down. Prices are rounded in the direction that
+        never worsens the order for its side: down for BUY, up for SELL.
+        Every change is logged at WARNING.
+        """
+        if not self._filters:
+            return
+
+        symbol = payload.symbol
+        filters = self._filters.get(symbol)
+        if filters is None:
+            raise TradingBotError(f"Unknown futures symbol: {symbol}")
+
+        lot_size = filters.get("LOT_SIZE")
+        if lot_size is not None:
+            step_size = lot_size["stepSize"]
+            quantity = self._quantize(payload.quantity, step_size, ROUND_DOWN)
+            if Decimal(quantity) <= 0:
+                raise TradingBotError(
+                    f"Quantity {payload.quantity} is below the step size "
+                    f"{step_size} for {symbol}."
+                )
+            self._log_adjustment(payload, "quantity", payload.quantity, quantity, step_size)
+            payload.quantity = quantity
+
+        price_filter = filters.get("PRICE_FILTER")
+        if price_filter is not None:
+            tick_size = price_filter["tickSize"]
+            rounding = ROUND_DOWN if payload.side == "BUY" else ROUND_UP
+            if payload.price is not None:
+                price = self._quantize(payload.price, tick_size, rounding)
+                self._log_adjustment(payload, "price", payload.price, price, tick_size)
+                payload.price = price
+            if payload.stopPrice is not None:
+                stop_price = self._quantize(payload.stopPrice, tick_size, rounding)
+                self._log_adjustment(
+                    payload, "stopPrice", payload.stopPrice, stop_price, tick_size
+                )
+                payload.stopPrice = stop_price
+
+    def _build_order_payload(self, params: OrderParams) -> _OrderPayload:
+        """
+        Map our normalized parameters to Binance Futures API parameters.
+
+        This bot sends all orders as standard futures orders:
+        - MARKET
+        - LIMIT
+        - STOP (used as STOP-LIMIT)
+        """
+        builder = _PAYLOAD_BUILDERS.get(params.order_type)
+        if builder is None:
             raise TradingBotError(f"Unsupported internal order type: {params.order_type}")
 
+        payload = builder(params)
+        self._apply_symbol_filters(payload)
         return payload
 
     def place_order(self, params: OrderParams) -> Dict[str, Any]:
@@ -267,31 +815,77 @@ class BasicBot:
         """
         payload = self._build_order_payload(params)
 
-        LOGGER.info(
-            "Placing order | symbol=%s side=%s type=%s qty=%s price=%s stopPrice=%s",
-            payload.get("symbol"),
-            payload.get("side"),
-            payload.get("type"),
-            payload.get("quantity"),
-            payload.get("price"),
-            payload.get("stopPrice"),
-        )
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(
+                "Placing order | symbol=%s side=%s type=%s qty=%s price=%s stopPrice=%s",
+                payload.symbol,
+                payload.side,
+                payload.type,
+                payload.quantity,
+                payload.price,
+                payload.stopPrice,
+            )
 
+        if self._use_ws and payload.type == "STOP":
+            # python-binance sends conditional orders to the algo-order REST
+            # endpoint; plain "order.place" would not be the same request.
+            raise TradingBotError(
+                "STOP_LIMIT orders are not supported over the WebSocket "
+                "session; place them without --ws."
+            )
+
+        self._order_limiter.acquire()
         try:
-            # futures_create_order uses futures (USDT-M) endpoints, not spot.
-            response = self.client.futures_create_order(**payload)
+            if self._use_ws:
+                response = self._ws_request("order.place", payload.as_params())
+            else:
+                # futures_create_order uses futures (USDT-M) endpoints, not spot.
+                response = self.client.futures_create_order(**payload.as_params())
             LOGGER.info("Order placed successfully. Binance response received.")
-            LOGGER.debug("Raw order response: %s", response)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Raw order response: %s", _json_dumps(response))
             return response
 
-        except (BinanceAPIException, BinanceOrderException, BinanceRequestException) as e:
+        except TradingBotError:
+            raise
+        except _binance().errors as e:
             # Known Binance-related errors (validation, insufficient margin, etc.)
-            LOGGER.error("Binance API error: %s", str(e))
-            raise TradingBotError(f"Binance API error: {e}") from None
+            LOGGER.error("Binance API error: %s", e)
+            raise TradingBotError("Binance API error", e)
         except Exception as e:
             # Unexpected issues (network, internal bugs, etc.)
-            LOGGER.error("Unexpected error while placing order: %s", str(e))
-            raise TradingBotError(f"Unexpected error while placing order: {e}") from None
+            LOGGER.error("Unexpected error while placing order: %s", e)
+            raise TradingBotError("Unexpected error while placing order", e)
+
+    def place_orders(
+        self, orders: Sequence[OrderParams], max_workers: int = 10
+    ) -> List[Union[Dict[str, Any], TradingBotError]]:
+        """
+        Place several futures orders concurrently.
+
+        Order placement is network-bound, so the orders are submitted from a
+        small thread pool sharing this bot's client (and its keep-alive HTTP
+        session) instead of one after another.
+
+        Returns
+        -------
+        list
+            One entry per input order, in input order: the raw Binance
+            response, or the TradingBotError raised for that order.
+        """
+
+        def _submit(params: OrderParams) -> Union[Dict[str, Any], TradingBotError]:
+            try:
+                return self.place_order(params)
+            except TradingBotError as e:
+                return e
+
+        if not orders:
+            return []
+
+        workers = max(1, min(max_workers, len(orders)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_submit, orders))
 
 
 # ---------------------------------------------------------------------------
@@ -299,8 +893,89 @@ class BasicBot:
 # ---------------------------------------------------------------------------
 
 
-def parse_args() -> argparse.Namespace:
+# Defaults for every option the CLI accepts, keyed by destination name.
+_CLI_DEFAULTS: Dict[str, Any] = {
+    "api_key": None,
+    "api_secret": None,
+    "symbol": None,
+    "side": None,
+    "type": None,
+    "qty": None,
+    "price": None,
+    "stop_price": None,
+    "ws": False,
+    "batch": None,
+    "daemon": False,
+}
+_CLI_FLAGS = frozenset(("ws", "daemon", "fast-cli"))
+
+
+def _fast_parse(argv: Sequence[str]) -> SimpleNamespace:
+    """
+    Minimal `--key value` / `--key=value` parser for scripted invocations.
+
+    Used instead of argparse when --fast-cli is given. There is no help
+    output; malformed or unknown options raise ValueError.
+    """
+    out = dict(_CLI_DEFAULTS)
+    it = iter(argv)
+    for arg in it:
+        if not arg.startswith("--"):
+            raise ValueError(f"Unexpected argument: {arg}")
+        key, sep, value = arg[2:].partition("=")
+        if key in _CLI_FLAGS:
+            if sep:
+                raise ValueError(f"--{key} does not take a value.")
+            if key != "fast-cli":
+                out[key] = True
+            continue
+        dest = key.replace("-", "_")
+        if dest not in out:
+            raise ValueError(f"Unknown option: --{key}")
+        if not sep:
+            value = next(it, None)
+            if value is None or value.startswith("--"):
+                raise ValueError(f"--{key} requires a value.")
+        out[dest] = value
+    return SimpleNamespace(**out)
+
+
+def _cli_usage_error(args: argparse.Namespace | SimpleNamespace) -> Optional[str]:
+    """Return a message if the parsed options do not form a valid invocation."""
+    if args.batch is not None and args.daemon:
+        return "--batch and --daemon cannot be used together"
+    if args.batch is None and not args.daemon:
+        missing = [
+            flag
+            for flag, value in (
+                ("--symbol", args.symbol),
+                ("--side", args.side),
+                ("--type", args.type),
+                ("--qty", args.qty),
+            )
+            if value is None
+        ]
+        if missing:
+            return f"the following arguments are required: {', '.join(missing)}"
+    return None
+
+
+def parse_args(
+    argv: Optional[Sequence[str]] = None,
+) -> argparse.Namespace | SimpleNamespace:
     """Parse command-line arguments."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if "--fast-cli" in argv:
+        args = _fast_parse(argv)
+        error = _cli_usage_error(args)
+        if error is not None:
+            raise ValueError(error)
+        return args
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Basic Binance USDT-M Futures Testnet trading bot."
     )
@@ -317,25 +992,21 @@ def parse_args() -> argparse.Namespace:
         help="Binance API secret (or set BINANCE_API_SECRET env var).",
     )
 
-    # Order parameters
+    # Order parameters (required unless --batch is given)
     parser.add_argument(
         "--symbol",
-        required=True,
         help="Trading symbol, e.g., BTCUSDT.",
     )
     parser.add_argument(
         "--side",
-        required=True,
         help="Order side: BUY or SELL.",
     )
     parser.add_argument(
         "--type",
-        required=True,
         help="Order type: MARKET, LIMIT, or STOP_LIMIT.",
     )
     parser.add_argument(
         "--qty",
-        required=True,
         help="Order quantity (e.g., 0.001).",
     )
     parser.add_argument(
@@ -347,14 +1018,141 @@ def parse_args() -> argparse.Namespace:
         dest="stop_price",
         help="Stop price (required for STOP_LIMIT).",
     )
+    parser.add_argument(
+        "--ws",
+        action="store_true",
+        help="Send orders over a persistent WebSocket session instead of REST.",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help=(
+            "JSON file with a list of orders (keys: symbol, side, type, qty, "
+            "price, stop_price), or a .csv file with those columns and a "
+            "header row, to place concurrently."
+        ),
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help=(
+            "Keep running and place orders read from stdin, one JSON object "
+            "per line (same keys as --batch), until EOF."
+        ),
+    )
+    parser.add_argument(
+        "--fast-cli",
+        action="store_true",
+        help=(
+            "Skip argparse and use a minimal --key value parser (for scripts "
+            "invoking the bot once per order)."
+        ),
+    )
+
+    args = parser.parse_args(argv)
+    error = _cli_usage_error(args)
+    if error is not None:
+        parser.error(error)
+    return args
+
+
+def _order_fields(entry: Dict[str, Any]) -> SimpleNamespace:
+    """Map a JSON order object onto the fields validate_order_params expects."""
+    return SimpleNamespace(
+        symbol=entry.get("symbol"),
+        side=entry.get("side"),
+        type=entry.get("type"),
+        qty=entry.get("qty"),
+        price=entry.get("price"),
+        stop_price=entry.get("stop_price"),
+    )
+
+
+# Column layout of CSV batch files (after a header row).
+_CSV_COLUMNS = ("symbol", "side", "type", "qty", "price", "stop_price")
+
+
+def _load_batch_csv(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a CSV batch file into order dicts.
 
-    return parser.parse_args()
+    The first row must be a header naming every column in _CSV_COLUMNS
+    (in any order); cells are matched to columns by that header. Rows are
+    parsed with the csv module, keeping cells as their original text (empty
+    cells become None; missing trailing cells count as empty). Values are
+    validated per order by load_batch_orders, the same as JSON batches.
+    """
+    with open(path, newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        header = next(reader, None)
+        if header is None:
+            return []
+        columns = [name.strip().lower() for name in header]
+        if sorted(columns) != sorted(_CSV_COLUMNS):
+            raise ValueError(
+                f"Batch file {path} must start with the header row "
+                f"{','.join(_CSV_COLUMNS)} (columns in any order)."
+            )
 
+        entries: List[Dict[str, Any]] = []
+        for row in reader:
+            if not row:
+                continue
+            if len(row) > len(columns):
+                raise ValueError(
+                    f"Batch order #{len(entries) + 1}: row has more cells "
+                    f"than the header ({len(row)} > {len(columns)})."
+                )
+            entry: Dict[str, Any] = dict.fromkeys(columns)
+            for name, value in zip(columns, row):
+                entry[name] = value.strip() or None
+            entries.append(entry)
+    return entries
+
+
+def load_batch_orders(path: str) -> List[OrderParams]:
+    """Load and validate a JSON or CSV (by .csv extension) batch file of orders."""
+    is_csv = path.lower().endswith(".csv")
+    try:
+        if is_csv:
+            entries = _load_batch_csv(path)
+        else:
+            with open(path, "rb") as fh:
+                data = fh.read()
+    except OSError as e:
+        raise ValueError(f"Could not read batch file {path}: {e}") from None
 
-def resolve_credentials(args: argparse.Namespace) -> tuple[str, str]:
+    if not is_csv:
+        try:
+            entries = _json_loads(data)
+        except ValueError as e:
+            raise ValueError(f"Batch file {path} is not valid JSON: {e}") from None
+        if not isinstance(entries, list):
+            raise ValueError("Batch file must contain a JSON list of orders.")
+
+    orders: List[OrderParams] = []
+    for index, entry in enumerate(entries, start=1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Batch order #{index} must be a JSON object.")
+        try:
+            orders.append(InputValidator.validate_order_params(_order_fields(entry)))
+        except ValueError as e:
+            raise ValueError(f"Batch order #{index}: {e}") from None
+    return orders
+
+
+# Credential environment variables, read once at import; the environment is
+# not expected to change while the bot (e.g., in --daemon mode) is running.
+_ENV_API_KEY = os.environ.get("BINANCE_API_KEY")
+_ENV_API_SECRET = os.environ.get("BINANCE_API_SECRET")
+
+
+def resolve_credentials(
+    args: argparse.Namespace | SimpleNamespace,
+) -> tuple[str, str]:
     """Resolve API key/secret from CLI or environment variables."""
-    api_key = args.api_key or os.getenv("BINANCE_API_KEY")
-    api_secret = args.api_secret or os.getenv("BINANCE_API_SECRET")
+    api_key = args.api_key or _ENV_API_KEY
+    api_secret = args.api_secret or _ENV_API_SECRET
 
     if not api_key or not api_secret:
         raise TradingBotError(
@@ -400,14 +1198,43 @@ def print_order_summary(order: Dict[str, Any]) -> None:
     status = order.get("status")
     executed_qty = order.get("executedQty")
 
-    print("\n=== Order Summary ===")
-    print(f"Order ID         : {order_id}")
-    print(f"Symbol           : {symbol}")
-    print(f"Side             : {side}")
-    print(f"Type             : {o_type}")
-    print(f"Status           : {status}")
-    print(f"Executed Quantity: {executed_qty}")
-    print("=====================\n")
+    # Written in one call so concurrent summaries (batch mode) never interleave.
+    sys.stdout.write(
+        "\n=== Order Summary ===\n"
+        f"Order ID         : {order_id}\n"
+        f"Symbol           : {symbol}\n"
+        f"Side             : {side}\n"
+        f"Type             : {o_type}\n"
+        f"Status           : {status}\n"
+        f"Executed Quantity: {executed_qty}\n"
+        "=====================\n\n"
+    )
+    sys.stdout.flush()
+
+
+def run_daemon(bot: BasicBot, stream: TextIO) -> None:
+    """
+    Place orders read from stream, one JSON object per line, until EOF.
+
+    The same bot (client, connection pool, exchange filters) serves every
+    order. Invalid or failed orders are reported and the loop moves on.
+    """
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = _json_loads(line)
+            if not isinstance(entry, dict):
+                raise ValueError("Order must be a JSON object.")
+            params = InputValidator.validate_order_params(_order_fields(entry))
+            print_order_summary(bot.place_order(params))
+        except ValueError as e:
+            LOGGER.error("Input validation error (line %d): %s", line_no, str(e))
+            print(f"Error (line {line_no}): {e}")
+        except TradingBotError as e:
+            LOGGER.error("Trading bot error (line %d): %s", line_no, str(e))
+            print(f"Error (line {line_no}): {e}")
 
 
 def main() -> None:
@@ -417,20 +1244,45 @@ def main() -> None:
     try:
         args = parse_args()
         LOGGER.info("CLI arguments parsed.")
-        params = InputValidator.validate_order_params(args)
-        LOGGER.info(
-            "Validated order params | symbol=%s side=%s type=%s qty=%s",
-            params.symbol,
-            params.side,
-            params.order_type,
-            params.quantity,
-        )
+        if args.daemon:
+            LOGGER.info("Daemon mode: reading orders from stdin.")
+        elif args.batch is not None:
+            orders = load_batch_orders(args.batch)
+            LOGGER.info("Validated %d batch orders from %s.", len(orders), args.batch)
+        else:
+            params = InputValidator.validate_order_params(args)
+            LOGGER.info(
+                "Validated order params | symbol=%s side=%s type=%s qty=%s",
+                params.symbol,
+                params.side,
+                params.order_type,
+                params.quantity,
+            )
 
         api_key, api_secret = resolve_credentials(args)
         bot = BasicBot(api_key=api_key, api_secret=api_secret, testnet=True)
 
-        order_response = bot.place_order(params)
-        print_order_summary(order_response)
+        if args.ws:
+            bot.start_ws_order_session()
+        try:
+            if args.daemon:
+                run_daemon(bot, sys.stdin)
+                return
+            if args.batch is not None:
+                results = bot.place_orders(orders)
+            else:
+                order_response = bot.place_order(params)
+        finally:
+            bot.close_ws_order_session()
+
+        if args.batch is not None:
+            for index, result in enumerate(results, start=1):
+                if isinstance(result, TradingBotError):
+                    print(f"Error (batch order #{index}): {result}")
+                else:
+                    print_order_summary(result)
+        else:
+            print_order_summary(order_response)
 
     except ValueError as e:
         # Input validation errors
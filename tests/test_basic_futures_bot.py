@@ -0,0 +1,611 @@
+import contextlib
+import hashlib
+import hmac
+import importlib.util
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+import basic_futures_bot as bfb
+
+
+class _RecordingBot:
+    """Stand-in for BasicBot that records orders instead of sending them."""
+
+    def __init__(self):
+        self.placed = []
+
+    def place_order(self, params):
+        self.placed.append(params)
+        return {"orderId": len(self.placed), "symbol": params.symbol, "status": "NEW"}
+
+
+class ImportCostTests(unittest.TestCase):
+    def test_heavy_dependencies_are_not_imported_at_module_import(self):
+        code = (
+            "import sys, basic_futures_bot; "
+            "heavy = ['argparse', 'binance', 'requests', 'websockets', 'numba', 'numpy']; "
+            "print(','.join(m for m in heavy if m in sys.modules))"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_positive_check(self):
+        check = bfb._positive_check()
+        self.assertTrue(check(0.001))
+        self.assertFalse(check(0.0))
+        self.assertFalse(check(float("nan")))
+
+
+class ParseArgsTests(unittest.TestCase):
+    ORDER = ["--symbol", "BTCUSDT", "--side", "BUY", "--type", "MARKET", "--qty", "0.001"]
+
+    def _parse(self, argv, fast):
+        """Parse argv with the fast parser or argparse; errors become ValueError."""
+        if fast:
+            return bfb.parse_args(["--fast-cli", *argv])
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            try:
+                return bfb.parse_args(argv)
+            except SystemExit:
+                raise ValueError(err.getvalue()) from None
+
+    def test_both_parsers(self):
+        for fast in (True, False):
+            with self.subTest(fast=fast):
+                args = self._parse(
+                    ["--symbol=BTCUSDT", "--side", "BUY", "--type=LIMIT", "--qty", "0.001",
+                     "--price=30000", "--stop-price", "29900", "--api-key=k", "--ws"],
+                    fast,
+                )
+                self.assertEqual(args.symbol, "BTCUSDT")
+                self.assertEqual(args.type, "LIMIT")
+                self.assertEqual(args.price, "30000")
+                self.assertEqual(args.stop_price, "29900")
+                self.assertEqual(args.api_key, "k")
+                self.assertIsNone(args.api_secret)
+                self.assertTrue(args.ws)
+                self.assertFalse(args.daemon)
+                self.assertIsNone(args.batch)
+
+                args = self._parse(["--batch", "orders.json"], fast)
+                self.assertEqual(args.batch, "orders.json")
+
+                args = self._parse(["--daemon"], fast)
+                self.assertTrue(args.daemon)
+
+    def test_errors_in_both_parsers(self):
+        cases = {
+            "missing value at end": self.ORDER[:-1],
+            "missing value before option": ["--qty", "--symbol", "BTCUSDT"],
+            "unknown option": self.ORDER + ["--bogus", "1"],
+            "flag given a value": self.ORDER + ["--ws=1"],
+            "batch with daemon": ["--batch", "orders.json", "--daemon"],
+            "required order options": ["--symbol", "BTCUSDT"],
+        }
+        for fast in (True, False):
+            for name, argv in cases.items():
+                with self.subTest(fast=fast, case=name):
+                    with self.assertRaises(ValueError):
+                        self._parse(argv, fast)
+
+    def test_fast_parser_messages(self):
+        for argv, message in (
+            (["--qty"], "--qty requires a value."),
+            (["--bogus=1"], "Unknown option: --bogus"),
+            (["--daemon=yes"], "--daemon does not take a value."),
+            (["BTCUSDT"], "Unexpected argument: BTCUSDT"),
+            (["--batch", "o.json", "--daemon"], "--batch and --daemon cannot be used together"),
+        ):
+            with self.subTest(argv=argv):
+                with self.assertRaisesRegex(ValueError, "^" + re.escape(message) + "$"):
+                    bfb.parse_args(["--fast-cli", *argv])
+
+
+class RunDaemonTests(unittest.TestCase):
+    def test_bad_lines_are_reported_and_skipped(self):
+        stream = io.StringIO(
+            '{"symbol": "BTCUSDT", "side": "BUY", "type": "MARKET", "qty": "0.001"}\n'
+            "\n"
+            '{"symbol": "BTCUSDT", "side": 5, "type": "MARKET", "qty": "0.001"}\n'
+            '{"symbol": 123456, "side": "BUY", "type": "MARKET", "qty": "0.001"}\n'
+            '{"symbol": "BTCUSDT", "side": "BUY", "type": 1, "qty": "0.001"}\n'
+            "not json\n"
+            '{"symbol": "ETHUSDT", "side": "SELL", "type": "MARKET", "qty": "0.01"}\n'
+        )
+        bot = _RecordingBot()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            bfb.run_daemon(bot, stream)
+
+        self.assertEqual([p.symbol for p in bot.placed], ["BTCUSDT", "ETHUSDT"])
+        text = out.getvalue()
+        self.assertIn("Error (line 3): Side must be a string", text)
+        self.assertIn("Error (line 4): Symbol must be a string.", text)
+        self.assertIn("Error (line 5): Order type must be a string.", text)
+        self.assertIn("Error (line 6):", text)
+        self.assertEqual(text.count("=== Order Summary ==="), 2)
+
+    def test_huge_price_does_not_stop_the_daemon(self):
+        bot = bfb.BasicBot.__new__(bfb.BasicBot)
+        bot._filters = {
+            "BTCUSDT": {
+                "LOT_SIZE": {"filterType": "LOT_SIZE", "stepSize": "0.001"},
+                "PRICE_FILTER": {"filterType": "PRICE_FILTER", "tickSize": "0.10"},
+            }
+        }
+        bot._use_ws = False
+        bot._order_limiter = bfb._RateLimiter(10)
+        bot.client = mock.Mock()
+        bot.client.futures_create_order.side_effect = lambda **p: {"orderId": 1, **p}
+
+        stream = io.StringIO(
+            '{"symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT", "qty": "0.001",'
+            ' "price": "9e999999"}\n'
+            '{"symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT", "qty": "0.001",'
+            ' "price": "30000"}\n'
+        )
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            bfb.run_daemon(bot, stream)
+
+        self.assertIn("Error (line 1): Price is too large.", out.getvalue())
+        self.assertEqual(bot.client.futures_create_order.call_count, 1)
+        self.assertEqual(
+            bot.client.futures_create_order.call_args.kwargs["price"], "30000"
+        )
+
+
+class ValidatePositiveFloatTests(unittest.TestCase):
+    def test_valid(self):
+        self.assertEqual(bfb.InputValidator.validate_positive_float("0.001", "Quantity"), 0.001)
+
+    def test_rejects_non_positive_and_non_finite(self):
+        for value, message in (
+            ("abc", "must be a number"),
+            (None, "must be a number"),
+            ("0", "must be greater than 0"),
+            ("-1", "must be greater than 0"),
+            ("nan", "must be greater than 0"),
+            ("-inf", "must be greater than 0"),
+            ("inf", "must be a finite number"),
+            ("1e999", "must be a finite number"),
+        ):
+            with self.subTest(value=value):
+                with self.assertRaisesRegex(ValueError, "Quantity " + message):
+                    bfb.InputValidator.validate_positive_float(value, "Quantity")
+
+
+class ValidatePositiveDecimalTests(unittest.TestCase):
+    def test_valid(self):
+        self.assertEqual(
+            str(bfb.InputValidator.validate_positive_decimal("30000.5", "Price")), "30000.5"
+        )
+
+    def test_rejects_non_numbers_and_out_of_range(self):
+        for value in ("abc", None, "", "1e9999999", "-1e9999999"):
+            with self.subTest(value=value):
+                with self.assertRaisesRegex(ValueError, "Price must be a number"):
+                    bfb.InputValidator.validate_positive_decimal(value, "Price")
+
+    def test_rejects_values_beyond_the_context_precision(self):
+        self.assertEqual(
+            str(bfb.InputValidator.validate_positive_decimal("999999999999999999", "Price")),
+            "999999999999999999",
+        )
+        for value in ("1e18", "9e999999"):
+            with self.subTest(value=value):
+                with self.assertRaisesRegex(ValueError, "Price is too large"):
+                    bfb.InputValidator.validate_positive_decimal(value, "Price")
+
+    def test_rejects_non_positive(self):
+        for value in ("0", "-1", "nan", "inf"):
+            with self.subTest(value=value):
+                with self.assertRaisesRegex(ValueError, "greater than 0"):
+                    bfb.InputValidator.validate_positive_decimal(value, "Price")
+
+
+class LoadBatchOrdersTests(unittest.TestCase):
+    def _write(self, suffix, text):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_valid_batch(self):
+        path = self._write(".json", json.dumps([
+            {"symbol": "btcusdt", "side": "buy", "type": "MARKET", "qty": "0.001"},
+            {"symbol": "BTCUSDT", "side": "SELL", "type": "LIMIT", "qty": 0.002, "price": "30000"},
+        ]))
+        orders = bfb.load_batch_orders(path)
+        self.assertEqual([o.order_type for o in orders], ["MARKET", "LIMIT"])
+        self.assertEqual(str(orders[1].price), "30000")
+
+    def test_bad_entry_is_reported_by_index(self):
+        path = self._write(".json", json.dumps([
+            {"symbol": "BTCUSDT", "side": "BUY", "type": "MARKET", "qty": "0.001"},
+            {"symbol": 123456, "side": "BUY", "type": "MARKET", "qty": "0.001"},
+        ]))
+        with self.assertRaisesRegex(ValueError, r"Batch order #2: Symbol must be a string"):
+            bfb.load_batch_orders(path)
+
+    def test_invalid_json(self):
+        path = self._write(".json", "{not json")
+        with self.assertRaisesRegex(ValueError, "not valid JSON"):
+            bfb.load_batch_orders(path)
+
+
+class LoadBatchCsvTests(unittest.TestCase):
+    HEADER = "symbol,side,type,qty,price,stop_price\n"
+
+    def _load(self, body, header=HEADER):
+        """Load body as a CSV batch with and without NumPy; results must agree."""
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as fh:
+            fh.write(header + body)
+        self.addCleanup(os.remove, path)
+
+        outcomes = []
+        modes = [{"numpy": None}]  # None in sys.modules makes the import fail
+        try:
+            import numpy  # noqa: F401
+            modes.append({})
+        except ImportError:
+            pass
+        for blocked in modes:
+            with mock.patch.dict(sys.modules, blocked):
+                try:
+                    outcomes.append(bfb.load_batch_orders(path))
+                except ValueError as e:
+                    outcomes.append(e)
+        # Same orders, or the same error message, whichever way it was loaded.
+        comparable = [str(o) if isinstance(o, ValueError) else o for o in outcomes]
+        for other in comparable[1:]:
+            self.assertEqual(other, comparable[0])
+        if isinstance(outcomes[0], ValueError):
+            raise outcomes[0]
+        return outcomes[0]
+
+    def test_valid_rows(self):
+        orders = self._load(
+            "BTCUSDT,BUY,LIMIT,0.001,30000.5,\n"
+            "ethusdt, sell ,STOP_LIMIT,0.01,2000,2010\n"
+        )
+        self.assertEqual([o.symbol for o in orders], ["BTCUSDT", "ETHUSDT"])
+        self.assertEqual(str(orders[0].price), "30000.5")
+        self.assertEqual(str(orders[1].stop_price), "2010")
+
+    def test_quoted_fields(self):
+        orders = self._load('"BTCUSDT","BUY","LIMIT","0.001","30000",""\n')
+        self.assertEqual(orders[0].order_type, "LIMIT")
+
+    def test_short_rows(self):
+        orders = self._load("BTCUSDT,BUY,MARKET,0.001\n")
+        self.assertIsNone(orders[0].price)
+
+    def test_reordered_header(self):
+        orders = self._load(
+            "BTCUSDT,BUY,STOP_LIMIT,0.001,29900,30000\n",
+            header="symbol,side,type,qty,stop_price,price\n",
+        )
+        self.assertEqual(str(orders[0].price), "30000")
+        self.assertEqual(str(orders[0].stop_price), "29900")
+
+    def test_missing_header(self):
+        with self.assertRaisesRegex(ValueError, "must start with the header row"):
+            self._load("BTCUSDT,BUY,MARKET,0.001,,\n", header="BTCUSDT,SELL,MARKET,0.002,,\n")
+
+    def test_unknown_or_duplicate_columns(self):
+        for header in (
+            "symbol,side,type,qty,price\n",
+            "symbol,side,type,qty,price,price\n",
+            "symbol,side,type,qty,price,stop_price,note\n",
+        ):
+            with self.subTest(header=header):
+                with self.assertRaisesRegex(ValueError, "must start with the header row"):
+                    self._load("BTCUSDT,BUY,MARKET,0.001\n", header=header)
+
+    def test_row_with_extra_cells(self):
+        with self.assertRaisesRegex(ValueError, "Batch order #2: row has more cells"):
+            self._load("BTCUSDT,BUY,MARKET,0.001,,\nBTCUSDT,BUY,MARKET,0.001,,,30000\n")
+
+    def test_empty_file(self):
+        self.assertEqual(self._load("", header=""), [])
+
+    def test_long_symbol_is_not_truncated(self):
+        with self.assertRaisesRegex(ValueError, "Batch order #1: Symbol looks invalid"):
+            self._load("ABCDEFGHIJKLMNOPQRSTUVWXYZ,BUY,MARKET,0.001,,\n")
+
+    def test_non_positive_quantity(self):
+        with self.assertRaisesRegex(ValueError, "Batch order #2: Quantity must be"):
+            self._load("BTCUSDT,BUY,MARKET,0.001,,\nBTCUSDT,BUY,MARKET,-1,,\n")
+
+    def test_first_invalid_row_is_reported(self):
+        with self.assertRaisesRegex(ValueError, "^Batch order #1: Symbol looks invalid"):
+            self._load("BAD,BUY,MARKET,0.001,,\nBTCUSDT,BUY,MARKET,-1,,\n")
+
+    def test_non_numeric_quantity(self):
+        with self.assertRaisesRegex(ValueError, "Batch order #1: Quantity must be a number"):
+            self._load("BTCUSDT,BUY,MARKET,abc,,\n")
+
+
+class SymbolFilterTests(unittest.TestCase):
+    def setUp(self):
+        self.bot = bfb.BasicBot.__new__(bfb.BasicBot)
+        self.bot._filters = {
+            "BTCUSDT": {
+                "LOT_SIZE": {"filterType": "LOT_SIZE", "stepSize": "0.001"},
+                "PRICE_FILTER": {"filterType": "PRICE_FILTER", "tickSize": "0.10"},
+            }
+        }
+
+    def _payload(self, side, quantity="0.001", price=None, stop_price=None):
+        return bfb._OrderPayload(
+            symbol="BTCUSDT",
+            side=side,
+            type="STOP" if stop_price else "LIMIT",
+            quantity=quantity,
+            timeInForce="GTC",
+            price=price,
+            stopPrice=stop_price,
+        )
+
+    def test_buy_price_rounds_down_with_warning(self):
+        payload = self._payload("BUY", price="30000.06", stop_price="29990.01")
+        with self.assertLogs(bfb.LOGGER, "WARNING") as logs:
+            self.bot._apply_symbol_filters(payload)
+        self.assertEqual(payload.price, "30000")
+        self.assertEqual(payload.stopPrice, "29990")
+        self.assertEqual(len(logs.records), 2)
+
+    def test_sell_price_rounds_up(self):
+        payload = self._payload("SELL", price="30000.01")
+        with self.assertLogs(bfb.LOGGER, "WARNING"):
+            self.bot._apply_symbol_filters(payload)
+        self.assertEqual(payload.price, "30000.1")
+
+    def test_quantity_rounds_down_with_warning(self):
+        payload = self._payload("SELL", quantity=0.0019, price="30000.1")
+        with self.assertLogs(bfb.LOGGER, "WARNING") as logs:
+            self.bot._apply_symbol_filters(payload)
+        self.assertEqual(payload.quantity, "0.001")
+        self.assertIn("quantity", logs.output[0])
+
+    def test_on_step_values_are_not_logged(self):
+        payload = self._payload("BUY", price="30000.10")
+        with self.assertNoLogs(bfb.LOGGER, "WARNING"):
+            self.bot._apply_symbol_filters(payload)
+        self.assertEqual(payload.price, "30000.1")
+
+    def test_rounding_overflow_is_a_bot_error(self):
+        with self.assertRaisesRegex(bfb.TradingBotError, "cannot be rounded to step size 0.10"):
+            bfb.BasicBot._quantize("9e999999", "0.10", bfb.ROUND_DOWN)
+
+    def test_quantity_below_step_and_unknown_symbol(self):
+        with self.assertRaisesRegex(bfb.TradingBotError, "below the step size"):
+            self.bot._apply_symbol_filters(self._payload("BUY", quantity=0.0004))
+        payload = self._payload("BUY")
+        payload.symbol = "ETHUSDT"
+        with self.assertRaisesRegex(bfb.TradingBotError, "Unknown futures symbol"):
+            self.bot._apply_symbol_filters(payload)
+
+
+@unittest.skipUnless(importlib.util.find_spec("binance"), "python-binance not installed")
+class FuturesClientSignatureTests(unittest.TestCase):
+    def test_hmac_signature_matches_a_fresh_hmac(self):
+        client_cls = bfb._binance().Client
+        client = client_cls.__new__(client_cls)
+        # Client.__del__ closes self.session, which __init__ would have set.
+        client.session = None
+        client._hmac_template = hmac.new(b"secret", digestmod=hashlib.sha256)
+        query = "symbol=BTCUSDT&side=BUY&timestamp=1"
+        expected = hmac.new(b"secret", query.encode(), hashlib.sha256).hexdigest()
+        self.assertEqual(client._hmac_signature(query), expected)
+        # The template is copied, not consumed.
+        self.assertEqual(client._hmac_signature(query), expected)
+
+
+class _FakeWebSocket:
+    """Answers each request with an unrelated reply first, then its own."""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+        self._replies = []
+
+    def send(self, message):
+        request = json.loads(message)
+        self.sent.append(request)
+        self._replies.append(json.dumps({"id": "other", "status": 200, "result": {}}))
+        self._replies.append(json.dumps({
+            "id": request["id"],
+            "status": 200,
+            "result": {"orderId": 7, "type": request["params"]["type"]},
+        }))
+
+    def recv(self, timeout=None):
+        return self._replies.pop(0)
+
+    def close(self):
+        self.closed = True
+
+
+class _ClosedWebSocket(_FakeWebSocket):
+    """A connection the server already closed."""
+
+    def send(self, message):
+        raise ConnectionError("connection closed")
+
+
+class _SilentWebSocket(_FakeWebSocket):
+    """Accepts requests but never replies."""
+
+    def send(self, message):
+        self.sent.append(json.loads(message))
+
+    def recv(self, timeout=None):
+        self.timeout = timeout
+        raise TimeoutError
+
+
+class WebSocketOrderTests(unittest.TestCase):
+    def setUp(self):
+        self.bot = bfb.BasicBot.__new__(bfb.BasicBot)
+        self.bot._api_key = "key"
+        self.bot._filters = {}
+        self.bot._order_limiter = bfb._RateLimiter(10)
+        self.bot._use_ws = True
+        self.bot._ws = _FakeWebSocket()
+        self.bot._ws_lock = threading.Lock()
+        self.bot._ws_replies = {}
+        self.bot.client = mock.Mock(timestamp_offset=-5000)
+        self.bot.client._hmac_signature.side_effect = lambda query: "sig:" + query
+
+    def test_market_order_is_signed_and_matched_by_id(self):
+        params = bfb.OrderParams("BTCUSDT", "BUY", "MARKET", 0.001)
+        with mock.patch.object(bfb.time, "time", return_value=1000.0):
+            response = self.bot.place_order(params)
+
+        self.assertEqual(response, {"orderId": 7, "type": "MARKET"})
+        request = self.bot._ws.sent[0]
+        self.assertEqual(request["method"], "order.place")
+        sent = request["params"]
+        self.assertEqual(sent["timestamp"], 1000000 - 5000)
+        self.assertEqual(
+            sent["signature"],
+            "sig:apiKey=key&quantity=0.001&side=BUY&symbol=BTCUSDT"
+            "&timestamp=995000&type=MARKET",
+        )
+        # The unrelated reply is parked for its own sender.
+        self.assertIn("other", self.bot._ws_replies)
+
+    def test_stop_limit_is_rejected(self):
+        params = bfb.OrderParams(
+            "BTCUSDT", "BUY", "STOP_LIMIT", 0.001,
+            price=Decimal("30000"), stop_price=Decimal("29900"),
+        )
+        with self.assertRaisesRegex(bfb.TradingBotError, "not supported over the WebSocket"):
+            self.bot.place_order(params)
+        self.assertEqual(self.bot._ws.sent, [])
+
+    def test_closed_connection_is_reopened_and_order_resent(self):
+        closed = self.bot._ws = _ClosedWebSocket()
+        fresh = _FakeWebSocket()
+        params = bfb.OrderParams("BTCUSDT", "BUY", "MARKET", 0.001)
+        with mock.patch.object(self.bot, "_connect_ws", return_value=fresh):
+            response = self.bot.place_order(params)
+
+        self.assertEqual(response, {"orderId": 7, "type": "MARKET"})
+        self.assertTrue(closed.closed)
+        self.assertIs(self.bot._ws, fresh)
+        self.assertEqual(len(fresh.sent), 1)
+
+    def test_missing_reply_times_out_and_next_order_reconnects(self):
+        silent = self.bot._ws = _SilentWebSocket()
+        params = bfb.OrderParams("BTCUSDT", "BUY", "MARKET", 0.001)
+        with self.assertRaisesRegex(bfb.TradingBotError, "order status unknown"):
+            self.bot.place_order(params)
+
+        self.assertLessEqual(silent.timeout, bfb.BasicBot.WS_REPLY_TIMEOUT)
+        self.assertTrue(silent.closed)
+        self.assertIsNone(self.bot._ws)
+        # The lock was released and the next order opens a new connection.
+        fresh = _FakeWebSocket()
+        with mock.patch.object(self.bot, "_connect_ws", return_value=fresh):
+            self.assertEqual(self.bot.place_order(params)["orderId"], 7)
+        self.assertEqual(len(fresh.sent), 1)
+        self.assertEqual(len(silent.sent), 1)
+
+
+class RateLimiterTests(unittest.TestCase):
+    def test_never_exceeds_rate_per_period(self):
+        clock = [100.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        limiter = bfb._RateLimiter(rate=3, period=1.0)
+        stamps = []
+        with mock.patch.object(bfb.time, "monotonic", lambda: clock[0]), \
+                mock.patch.object(bfb.time, "sleep", fake_sleep):
+            for _ in range(10):
+                limiter.acquire()
+                stamps.append(clock[0])
+                clock[0] += 0.05
+
+        # Any 4 consecutive acquisitions must span at least one period.
+        for first, fourth in zip(stamps, stamps[3:]):
+            self.assertGreaterEqual(fourth - first, 1.0 - 1e-9)
+        # ...and the limiter does not wait longer than needed.
+        self.assertLess(stamps[-1] - stamps[0], 4.0)
+
+    def test_concurrent_acquisitions_are_bounded(self):
+        limiter = bfb._RateLimiter(rate=4, period=0.2)
+        stamps = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(3):
+                limiter.acquire()
+                with lock:
+                    stamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stamps.sort()
+        self.assertEqual(len(stamps), 12)
+        # 12 acquisitions at 4 per 0.2s need at least two full periods.
+        self.assertGreaterEqual(stamps[-1] - stamps[0], 0.4 - 0.02)
+
+
+class PlaceOrdersTests(unittest.TestCase):
+    def test_results_keep_input_order_and_capture_errors(self):
+        bot = bfb.BasicBot.__new__(bfb.BasicBot)
+        delays = {"A": 0.05, "B": 0.0, "C": 0.02}
+
+        def place_order(params):
+            time.sleep(delays[params.symbol])
+            if params.symbol == "C":
+                raise bfb.TradingBotError("Binance API error", RuntimeError("rejected"))
+            return {"symbol": params.symbol}
+
+        bot.place_order = place_order
+        orders = [
+            bfb.OrderParams(symbol=s, side="BUY", order_type="MARKET", quantity=1.0)
+            for s in ("A", "B", "C")
+        ]
+        results = bot.place_orders(orders, max_workers=3)
+
+        self.assertEqual(results[0], {"symbol": "A"})
+        self.assertEqual(results[1], {"symbol": "B"})
+        self.assertIsInstance(results[2], bfb.TradingBotError)
+        self.assertEqual(str(results[2]), "Binance API error: rejected")
+
+    def test_empty(self):
+        bot = bfb.BasicBot.__new__(bfb.BasicBot)
+        self.assertEqual(bot.place_orders([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()